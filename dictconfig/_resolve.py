@@ -27,6 +27,7 @@ can be referenced using the standard Jinja dot notation; for example:
 """
 import copy
 import dataclasses
+import functools
 import re
 import typing
 
@@ -35,14 +36,46 @@ import jinja2
 from . import exceptions
 from . import parsers as _parsers
 
+
+def _memoized_parser(parser, maxsize=256):
+    """Wrap a parser with a cache keyed on the raw value.
+
+    Real configurations repeat values -- the same boolean, integer, or date
+    literal appears many times -- and the default parsers are pure functions,
+    so repeated values can skip the parse entirely. Only hashable scalar
+    values are cached; the cache key includes the type so that, e.g., True
+    and 1 do not collide. The cache is cleared once it reaches `maxsize`.
+
+    """
+    cache = {}
+
+    def wrapper(value):
+        if type(value) not in (str, int, float, bool):
+            return parser(value)
+
+        key = (type(value), value)
+        try:
+            return cache[key]
+        except KeyError:
+            pass
+
+        result = parser(value)
+        if len(cache) >= maxsize:
+            cache.clear()
+        cache[key] = result
+        return result
+
+    return wrapper
+
+
 # the default parsers used by resolve()
 DEFAULT_PARSERS = {
-    "integer": _parsers.arithmetic(int),
-    "float": _parsers.arithmetic(float),
+    "integer": _memoized_parser(_parsers.arithmetic(int)),
+    "float": _memoized_parser(_parsers.arithmetic(float)),
     "string": str,
-    "boolean": _parsers.logic,
-    "date": _parsers.smartdate,
-    "datetime": _parsers.smartdatetime,
+    "boolean": _memoized_parser(_parsers.logic),
+    "date": _memoized_parser(_parsers.smartdate),
+    "datetime": _memoized_parser(_parsers.smartdatetime),
     "any": lambda x: x,
 }
 
@@ -160,6 +193,17 @@ def resolve(
     if schema_validator is not None:
         schema_validator(schema)
 
+    if (
+        schema["type"] == "any"
+        and raw_cfg is not None
+        and not _contains_template_syntax(raw_cfg)
+    ):
+        # the whole configuration is untyped and contains nothing to
+        # interpolate, so resolution is the identity; skip the node machinery
+        if preserve_type:
+            return copy.deepcopy(raw_cfg)
+        return _untyped_copy(raw_cfg)
+
     parsers = _update_parsers(override_parsers)
     resolution_context = _ResolutionContext(external_variables, parsers)
 
@@ -177,7 +221,13 @@ def resolve(
 
 
 def _is_leaf(x):
-    return not isinstance(x, dict) and not isinstance(x, list)
+    # exact-type checks catch the overwhelmingly common case with a single
+    # pointer compare; the isinstance fallback keeps dict/list subclasses
+    # (as allowed by preserve_type) working
+    tp = type(x)
+    if tp is dict or tp is list:
+        return False
+    return not isinstance(x, (dict, list))
 
 
 def _copy_into(dst, src):
@@ -201,15 +251,25 @@ def _copy_into(dst, src):
 
 
 def _provide_context_to_leaf_nodes(node, resolution_context):
-    """Set the resolution_context for all leaf nodes, recursively."""
-    if isinstance(node, _LeafNode):
-        node.resolution_context = resolution_context
-    elif isinstance(node, _DictNode):
-        for child in node.children.values():
-            _provide_context_to_leaf_nodes(child, resolution_context)
-    elif isinstance(node, _ListNode):
-        for child in node.children:
-            _provide_context_to_leaf_nodes(child, resolution_context)
+    """Set the resolution_context for all leaf nodes.
+
+    The traversal is iterative, using a list as a stack, so that deep
+    configurations do not pay a call frame per node or hit the recursion
+    limit.
+
+    """
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, _LeafNode):
+            node.resolution_context = resolution_context
+            # bind the parser here so that resolving the leaf does not have
+            # to look its type name up in the parsers table
+            node.parser = resolution_context.parsers.get(node.type_)
+        elif isinstance(node, _DictNode):
+            stack.extend(node.children.values())
+        elif isinstance(node, _ListNode):
+            stack.extend(node.children)
 
 
 def _update_parsers(overrides):
@@ -238,13 +298,19 @@ def _update_parsers(overrides):
 #       nodes.
 
 
-def _build_configuration_tree_node(raw_cfg, schema, parent=None, keypath=tuple()):
-    """Recursively constructs a configuration tree from a raw configuration.
+def _build_configuration_tree_node(raw_cfg, schema, parent=None, keypath=None):
+    """Constructs a configuration tree from a raw configuration.
 
     The raw configuration can be a dictionary, list, or a non-container type. In any
     case, the provided schema must match the type of the raw configuration; for example,
     if the raw configuration is a dictionary, the schema must be a dict schema.
 
+    The tree is built iteratively with an explicit work stack rather than by
+    recursing: a deep configuration would otherwise pay a Python call frame
+    per node and could hit the recursion limit. Each work item records the
+    slot -- a (container, key) pair -- that the constructed node should be
+    placed into; for the root node this is a one-element placeholder list.
+
     Parameters
     ----------
     raw_cfg
@@ -259,34 +325,323 @@ def _build_configuration_tree_node(raw_cfg, schema, parent=None, keypath=tuple()
     -------
         The configuration tree.
 
+    """
+    root_holder = [None]
+    work = [(raw_cfg, schema, parent, keypath, root_holder, 0)]
+
+    # per-build caches: schema-derived key maps (see _merged_key_schemas) and
+    # template-syntax flags for untyped subtrees (see _subtree_has_template)
+    schema_cache = {}
+    syntax_cache = {}
+
+    while work:
+        item = work.pop()
+        if item[0] is _DEFERRED_CHECK:
+            item[1](*item[2])
+            continue
+        raw, node_schema, node_parent, node_keypath, container, key = item
+        container[key] = _make_node(
+            raw,
+            node_schema,
+            node_parent,
+            node_keypath,
+            work,
+            schema_cache,
+            syntax_cache,
+        )
+
+    return root_holder[0]
+
+
+def _merged_key_schemas(dict_schema, schema_cache):
+    """The merged required+optional key schemas of a dict schema, cached.
+
+    The same schema dict is applied to many nodes -- most notably, every
+    element of a list of dicts shares one element schema -- and rebuilding
+    the merged map for each sibling is wasted work. The cache is keyed on
+    id(schema); this is safe because it only lives for a single tree build,
+    during which the caller's schema (and hence every sub-schema) is alive.
+
+    """
+    cache_key = id(dict_schema)
+    try:
+        return schema_cache[cache_key]
+    except KeyError:
+        merged = {
+            **dict_schema.get("required_keys", {}),
+            **dict_schema.get("optional_keys", {}),
+        }
+        schema_cache[cache_key] = merged
+        return merged
+
+
+def _subtree_has_template(raw_cfg, syntax_cache):
+    """Check whether any string leaf of a raw subtree needs interpolation.
+
+    Results are cached by container identity in syntax_cache, which lives
+    for a single tree build. On a miss the flag is computed bottom-up for
+    the container and every container beneath it in one pass, so that when
+    the children of an "any" subtree are visited later they hit the cache
+    instead of re-scanning: without this, nested untyped containers would
+    make construction quadratic in the depth of the subtree.
+
+    """
+    flag = syntax_cache.get(id(raw_cfg))
+    if flag is not None:
+        return flag
+
+    # collect the containers in preorder; parents precede their children, so
+    # walking the list in reverse computes each child's flag before its
+    # parent needs it
+    order = []
+    stack = [raw_cfg]
+    while stack:
+        value = stack.pop()
+        tp = type(value)
+        if tp is dict or isinstance(value, dict):
+            order.append(value)
+            stack.extend(value.values())
+        elif tp is list or isinstance(value, list):
+            order.append(value)
+            stack.extend(value)
+
+    for container in reversed(order):
+        values = container.values() if isinstance(container, dict) else container
+        dirty = False
+        for value in values:
+            tp = type(value)
+            if tp is str:
+                if _may_need_interpolation(value):
+                    dirty = True
+                    break
+            elif tp is dict or tp is list or isinstance(value, (dict, list)):
+                if syntax_cache[id(value)]:
+                    dirty = True
+                    break
+            elif isinstance(value, str) and _may_need_interpolation(value):
+                dirty = True
+                break
+        syntax_cache[id(container)] = dirty
+
+    return syntax_cache[id(raw_cfg)]
+
+
+def _contains_template_syntax(raw_cfg):
+    """Check whether any string leaf of a raw subtree needs interpolation.
+
+    Iterative, and short-circuits on the first string that could contain
+    template syntax. Used by the top-level resolve() fast path, which scans
+    at most once; the tree build itself uses _subtree_has_template, whose
+    per-build cache avoids re-scanning nested untyped subtrees.
+
+    """
+    stack = [raw_cfg]
+    while stack:
+        value = stack.pop()
+        tp = type(value)
+        if tp is str:
+            if _may_need_interpolation(value):
+                return True
+        elif tp is dict or isinstance(value, dict):
+            stack.extend(value.values())
+        elif tp is list or isinstance(value, list):
+            stack.extend(value)
+        elif isinstance(value, str) and _may_need_interpolation(value):
+            return True
+    return False
+
+
+def _untyped_copy(raw_cfg):
+    """Copy a raw subtree into plain dicts and lists, leaves as-is.
+
+    Produces exactly what resolving the subtree under an "any" schema would:
+    every dict becomes a plain dict, every list a plain list, and leaf
+    values are passed through untouched.
+
+    """
+    if _is_leaf(raw_cfg):
+        return raw_cfg
+
+    root_holder = [None]
+    stack = [(raw_cfg, root_holder, 0)]
+
+    while stack:
+        value, container, key = stack.pop()
+        tp = type(value)
+        if tp is dict or isinstance(value, dict):
+            out = dict.fromkeys(value)
+            container[key] = out
+            for child_key, child in value.items():
+                stack.append((child, out, child_key))
+        elif tp is list or isinstance(value, list):
+            out = [None] * len(value)
+            container[key] = out
+            for i, child in enumerate(value):
+                stack.append((child, out, i))
+        else:
+            container[key] = value
+
+    return root_holder[0]
+
+
+def _make_node(raw_cfg, schema, parent, keypath, work, schema_cache, syntax_cache):
+    """Make a single tree node, pushing work items for any children.
+
+    The configuration tree is a nested container whose terminal leaf values
+    are _LeafNodes. "Internal" nodes are dictionaries or lists; their children
+    are not built here but are instead pushed onto the work stack.
+
     """
     if raw_cfg is None:
-        if "nullable" in schema and schema["nullable"]:
-            return _LeafNode.from_raw(None, {"type": "any"}, keypath, parent=parent)
+        if schema.get("nullable"):
+            return _LeafNode.from_raw(None, _ANY_LEAF_SCHEMA, keypath, parent=parent)
         else:
-            raise exceptions.ResolutionError("Unexpectedly null.", keypath)
+            raise exceptions.ResolutionError(
+                "Unexpectedly null.", _materialize_keypath(keypath)
+            )
 
-    # construct the configuration tree
-    # the configuration tree is a nested container whose terminal leaf values
-    # are _LeafNodes. "Internal" nodes are dictionaries or lists.
-    if isinstance(raw_cfg, dict):
+    tp = type(raw_cfg)
+    if tp is dict or isinstance(raw_cfg, dict):
         if schema["type"] == "any":
-            schema = {
-                "type": "dict",
-                "extra_keys_schema": {"type": "any", "nullable": True},
-            }
-        return _DictNode.from_raw(raw_cfg, schema, keypath, parent=parent)
-    elif isinstance(raw_cfg, list):
+            # fast path: an untyped subtree with no template syntax resolves
+            # to a plain copy of itself, so the per-entry node machinery can
+            # be skipped entirely
+            if not _subtree_has_template(raw_cfg, syntax_cache):
+                return _LeafNode.from_raw(
+                    _untyped_copy(raw_cfg), _ANY_LEAF_SCHEMA, keypath, parent=parent
+                )
+            schema = _ANY_DICT_SCHEMA
+        node = _DictNode(parent=parent)
+        _push_dict_children(work, raw_cfg, schema, node, keypath, schema_cache)
+        return node
+    elif tp is list or isinstance(raw_cfg, list):
         if schema["type"] == "any":
-            schema = {
-                "type": "list",
-                "element_schema": {"type": "any", "nullable": True},
-            }
-        return _ListNode.from_raw(raw_cfg, schema, keypath, parent=parent)
+            if not _subtree_has_template(raw_cfg, syntax_cache):
+                return _LeafNode.from_raw(
+                    _untyped_copy(raw_cfg), _ANY_LEAF_SCHEMA, keypath, parent=parent
+                )
+            schema = _ANY_LIST_SCHEMA
+        node = _ListNode([None] * len(raw_cfg), parent=parent)
+        child_schema = schema["element_schema"]
+        # pushed in reverse so that elements pop off the LIFO stack -- and are
+        # therefore built -- in forward order, matching the recursive walk
+        for i in range(len(raw_cfg) - 1, -1, -1):
+            work.append(
+                (raw_cfg[i], child_schema, node, (keypath, i), node.children, i)
+            )
+        return node
     else:
         return _LeafNode.from_raw(raw_cfg, schema, keypath, parent=parent)
 
 
+# matches references to other values, like "${this.foo}"; compiled once here
+# rather than on every access of _LeafNode.references
+_REFERENCE_RE = re.compile(r"\$\{\s?(.+?)\s?\}")
+
+
+# keypaths during tree construction
+# ---------------------------------
+# While the configuration tree is being built, keypaths are represented as
+# singly-linked (parent_link, key) pairs instead of tuples: extending a path
+# by one key is then a single small allocation rather than a copy of the
+# whole path. The empty path is None. A linked path is materialized into an
+# ordinary tuple only when it is actually needed -- when raising an
+# exception, or when an error message must report a location.
+
+
+def _materialize_keypath(link):
+    """Convert a linked (parent_link, key) keypath into a tuple."""
+    parts = []
+    while link is not None:
+        link, key = link
+        parts.append(key)
+    return tuple(reversed(parts))
+
+
+def _may_need_interpolation(s):
+    """Quickly check whether a string could contain template syntax.
+
+    Variables are delimited by ${ }, but Jinja also processes {% %} blocks
+    and {# #} comments, so all three openers are checked. Plain strings --
+    the common case -- can then bypass the template engine entirely.
+
+    """
+    return "${" in s or "{%" in s or "{#" in s
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile_template(s):
+    """Compile an interpolation string into a Jinja2 template.
+
+    Compiling a template runs Jinja's lexer, parser, and code generator and
+    is far more expensive than rendering it, so compiled templates are cached
+    by their source string.
+
+    """
+    return jinja2.Template(s, variable_start_string="${", variable_end_string="}")
+
+
+# shared schemas used when an "any" schema is applied to a container; built
+# once here instead of on every node. These are never mutated.
+_ANY_NULLABLE_SCHEMA = {"type": "any", "nullable": True}
+_ANY_DICT_SCHEMA = {"type": "dict", "extra_keys_schema": _ANY_NULLABLE_SCHEMA}
+_ANY_LIST_SCHEMA = {"type": "list", "element_schema": _ANY_NULLABLE_SCHEMA}
+_ANY_LEAF_SCHEMA = {"type": "any"}
+
+
+def _find_root(node):
+    """Walk parent pointers up to the root of the tree.
+
+    Iterative rather than recursive: the walk is performed for every leaf
+    interpolation (the root is passed to Jinja as "this"), and recursing
+    through the parent chain would cost a call frame per level. Each node
+    caches the result, since the tree never changes shape once built.
+
+    """
+    while node.parent is not None:
+        node = node.parent
+    return node
+
+
+def _resolve_tree(node):
+    """Resolve a (sub)tree of the configuration into containers and values.
+
+    The output is built iteratively with a work stack rather than by
+    recursing through the container nodes' resolve() methods, so that deep
+    configurations do not pay a call frame per node or hit the recursion
+    limit. Each work item is a node together with the (container, key) slot
+    its resolved value should be written into; container nodes create their
+    output dict or list when popped and push their children.
+
+    """
+    if isinstance(node, _LeafNode):
+        return node.resolve()
+
+    root_holder = [None]
+    work = [(node, root_holder, 0)]
+
+    while work:
+        node_, container, key = work.pop()
+        if isinstance(node_, _LeafNode):
+            container[key] = node_.resolve()
+        elif isinstance(node_, _DictNode):
+            # pre-create the keys so the output preserves the child order;
+            # children are pushed in reverse so they resolve -- and raise --
+            # in forward order, as the recursive walk did
+            out = dict.fromkeys(node_.children)
+            container[key] = out
+            for child_key, child in reversed(node_.children.items()):
+                work.append((child, out, child_key))
+        else:
+            children = node_.children
+            out = [None] * len(children)
+            container[key] = out
+            for i in range(len(children) - 1, -1, -1):
+                work.append((children[i], out, i))
+
+    return root_holder[0]
+
+
 # denotes that a node is currently being resolved
 _PENDING = object()
 
@@ -307,22 +662,12 @@ class _DictNode:
 
     """
 
+    __slots__ = ("children", "parent", "_root")
+
     def __init__(self, children=None, parent=None):
         self.children = {} if children is None else children
         self.parent = parent
-
-    @classmethod
-    def from_raw(cls, dct, dict_schema, keypath, parent=None):
-        """Construct a _DictNode from a raw configuration dictionary and its schema."""
-        node = cls(parent=parent)
-
-        children = {}
-        _populate_required_keys_children(children, dct, dict_schema, node, keypath)
-        _populate_optional_keys_children(children, dct, dict_schema, node, keypath)
-        _populate_extra_keys_children(children, dct, dict_schema, node, keypath)
-
-        node.children = children
-        return node
+        self._root = None
 
     def __getitem__(self, ix):
         child = self.children[ix]
@@ -333,66 +678,103 @@ class _DictNode:
 
     @property
     def root(self):
-        if self.parent is None:
-            return self
-        else:
-            return self.parent.root
+        if self._root is None:
+            self._root = _find_root(self)
+        return self._root
 
     def resolve(self):
-        """Recursively resolve the _DictNode into a dictionary."""
-        return {key: child.resolve() for key, child in self.children.items()}
+        """Resolve the _DictNode into a dictionary."""
+        return _resolve_tree(self)
 
 
-def _populate_required_keys_children(children, dct, dict_schema, parent, keypath):
-    required_keys = dict_schema.get("required_keys", {})
+# marks a work item holding a deferred check rather than a node to build;
+# such items are (marker, function, args) triples
+_DEFERRED_CHECK = object()
 
-    for key, key_schema in required_keys.items():
-        if key not in dct:
-            raise exceptions.ResolutionError(
-                "Missing required key.", (keypath + (key,))
-            )
 
-        children[key] = _build_configuration_tree_node(
-            dct[key], key_schema, parent, keypath + (key,)
-        )
+def _raise_missing_key(key, keypath):
+    raise exceptions.ResolutionError(
+        "Missing required key.", _materialize_keypath(keypath) + (key,)
+    )
 
 
-def _populate_optional_keys_children(children, dct, dict_schema, parent, keypath):
-    optional_keys = dict_schema.get("optional_keys", {})
+def _check_extra_keys(work, dct, dict_schema, parent, keypath, schema_cache):
+    """Check a dict node for extra keys, pushing work items to build them.
 
-    for key, key_schema in optional_keys.items():
-        if key in dct:
-            # key is not missing
-            value = dct[key]
-        elif "default" in key_schema:
-            # key is missing and default was provided
-            value = key_schema["default"]
-        else:
-            # key is missing and no default was provided
-            continue
+    Runs as a deferred work item after every expected child's subtree has
+    been built, as the recursive walk's extra-key sweep did.
+
+    """
+    key_schemas = _merged_key_schemas(dict_schema, schema_cache)
+    extra_keys = dct.keys() - key_schemas.keys()
 
-        children[key] = _build_configuration_tree_node(
-            value, key_schema, parent, keypath + (key,)
+    if not extra_keys:
+        return
+
+    extra_keys_schema = dict_schema.get("extra_keys_schema")
+    if extra_keys_schema is None:
+        raise exceptions.ResolutionError(
+            "Unexpected extra key.", _materialize_keypath(keypath) + (extra_keys.pop(),)
         )
 
+    children = parent.children
+    items = [
+        (dct[key], extra_keys_schema, parent, (keypath, key), children, key)
+        for key in extra_keys
+    ]
+    work.extend(reversed(items))
 
-def _populate_extra_keys_children(children, dct, dict_schema, parent, keypath):
-    required_keys = dict_schema.get("required_keys", {})
 
+def _push_dict_children(work, dct, dict_schema, parent, keypath, schema_cache):
+    """Push work items for every child of a dict node.
+
+    Children are enumerated in the same order the recursive walk built them:
+    required keys in schema order, then optional keys (present or defaulted)
+    in schema order, then extra keys. The items are pushed onto the LIFO
+    work stack in reverse so that they pop -- and are built -- in that
+    order.
+
+    The checks the recursive walk performed between child builds are pushed
+    as deferred items so they keep their place relative to errors raised
+    inside the children's subtrees: a missing required key is reported only
+    after the required keys before it have been built, and the extra-key
+    sweep runs only after every expected child has been built.
+
+    """
+    required_keys = dict_schema.get("required_keys", {})
     optional_keys = dict_schema.get("optional_keys", {})
-    expected_keys = set(required_keys) | set(optional_keys)
-    extra_keys = dct.keys() - expected_keys
+    children = parent.children
 
-    if extra_keys and "extra_keys_schema" not in dict_schema:
-        raise exceptions.ResolutionError(
-            f"Unexpected extra key.", keypath + (extra_keys.pop(),)
-        )
+    items = []
+    deferred = None
 
-    for key in extra_keys:
-        children[key] = _build_configuration_tree_node(
-            dct[key], dict_schema["extra_keys_schema"], parent, keypath + (key,)
+    for key, key_schema in required_keys.items():
+        if key not in dct:
+            deferred = (_DEFERRED_CHECK, _raise_missing_key, (key, keypath))
+            break
+        items.append((dct[key], key_schema, parent, (keypath, key), children, key))
+
+    if deferred is None:
+        for key, key_schema in optional_keys.items():
+            if key in dct:
+                value = dct[key]
+            elif "default" in key_schema:
+                value = key_schema["default"]
+            else:
+                continue
+            items.append((value, key_schema, parent, (keypath, key), children, key))
+
+        deferred = (
+            _DEFERRED_CHECK,
+            _check_extra_keys,
+            (work, dct, dict_schema, parent, keypath, schema_cache),
         )
 
+    # the deferred check goes on first so that it pops only after the
+    # children above it -- and their entire subtrees -- have been built
+    work.append(deferred)
+    work.extend(reversed(items))
+
 
 class _ListNode:
     """Represents an internal list node in a configuration tree.
@@ -407,26 +789,12 @@ class _ListNode:
 
     """
 
+    __slots__ = ("children", "parent", "_root")
+
     def __init__(self, children=None, parent=None):
-        self.children = {} if children is None else {}
+        self.children = [] if children is None else children
         self.parent = parent
-
-    @classmethod
-    def from_raw(cls, lst, list_schema, keypath, parent=None):
-        """Make an internal list node from a raw list and recurse on the children."""
-        node = cls(parent=parent)
-
-        child_schema = list_schema["element_schema"]
-
-        children = []
-        for i, lst_value in enumerate(lst):
-            r = _build_configuration_tree_node(
-                lst_value, child_schema, node, keypath + (i,)
-            )
-            children.append(r)
-
-        node.children = children
-        return node
+        self._root = None
 
     def __getitem__(self, ix):
         child = self.children[ix]
@@ -437,14 +805,13 @@ class _ListNode:
 
     @property
     def root(self):
-        if self.parent is None:
-            return self
-        else:
-            return self.parent.root
+        if self._root is None:
+            self._root = _find_root(self)
+        return self._root
 
     def resolve(self):
-        """Recursively resolve the _ListNode into a list."""
-        return [child.resolve() for child in self.children]
+        """Resolve the _ListNode into a list."""
+        return _resolve_tree(self)
 
 
 class _LeafNode:
@@ -470,16 +837,38 @@ class _LeafNode:
 
     """
 
+    __slots__ = (
+        "raw",
+        "type_",
+        "parent",
+        "nullable",
+        "resolution_context",
+        "parser",
+        "_keypath_link",
+        "_keypath",
+        "_resolved",
+        "_references",
+        "_root",
+    )
+
     def __init__(
         self, raw, type_, parent, keypath, resolution_context=None, nullable=False
     ):
         self.raw = raw
         self.type_ = type_
         self.parent = parent
-        self.keypath = keypath
         self.nullable = nullable
         self.resolution_context = resolution_context
 
+        # the parser bound to this leaf's type; set alongside
+        # resolution_context when the context is provided to the tree
+        self.parser = None
+
+        # the keypath is stored in its linked (parent_link, key) form and
+        # materialized into a tuple only if an error must report it
+        self._keypath_link = keypath
+        self._keypath = None
+
         # The resolved value of the leaf node. There are two special values. If
         # this is _UNDISCOVERED, the resolution process has not yet discovered
         # the leaf node (this is the default value). If this is _PENDING, a
@@ -487,17 +876,29 @@ class _LeafNode:
         # this contains the resolved value.
         self._resolved = _UNDISCOVERED
 
+        # cache for the references property; self.raw never changes, so the
+        # references need only be computed once
+        self._references = None
+
+        # cache for the root property
+        self._root = None
+
     @classmethod
     def from_raw(cls, raw, leaf_schema, keypath, nullable=False, parent=None):
         """Create a leaf node from the raw configuration and schema."""
         return cls(raw, leaf_schema["type"], parent, keypath, nullable)
 
+    @property
+    def keypath(self):
+        if self._keypath is None:
+            self._keypath = _materialize_keypath(self._keypath_link)
+        return self._keypath
+
     @property
     def root(self):
-        if self.parent is None:
-            return self
-        else:
-            return self.parent.root
+        if self._root is None:
+            self._root = _find_root(self)
+        return self._root
 
     @property
     def references(self):
@@ -516,11 +917,13 @@ class _LeafNode:
         ['self.x', 'self.y']
 
         """
-        if not isinstance(self.raw, str):
-            return []
+        if self._references is None:
+            if isinstance(self.raw, str) and "${" in self.raw:
+                self._references = _REFERENCE_RE.findall(self.raw)
+            else:
+                self._references = []
 
-        pattern = r"\$\{\s?(.+?)\s?\}"
-        return re.findall(pattern, self.raw)
+        return self._references
 
     def resolve(self):
         """Resolve the leaf's value by 1) interpolating and 2) parsing.
@@ -563,25 +966,25 @@ class _LeafNode:
         The interpolated string.
 
         """
-        template = jinja2.Template(
-            s, variable_start_string="${", variable_end_string="}"
-        )
+        if not _may_need_interpolation(s):
+            return s
+
+        template = _compile_template(s)
+
+        context = self.resolution_context.render_context
+        context["this"] = self.root
 
         try:
-            return template.render(
-                **self.resolution_context.external_variables, this=self.root
-            )
+            return template.render(context)
         except jinja2.exceptions.UndefinedError as exc:
             raise exceptions.ResolutionError(str(exc), self.keypath)
 
     def _parse(self, s, type_):
         """Parse the configuration string into its final type."""
-        try:
-            parser = self.resolution_context.parsers[type_]
-        except KeyError:
+        if self.parser is None:
             raise exceptions.Error(f'No parser for type "{type_}".')
 
-        return parser(s)
+        return self.parser(s)
 
     def _safely(self, fn, *args):
         try:
@@ -596,97 +999,147 @@ class _ResolutionContext:
     external_variables: typing.Mapping
     parsers: typing.Mapping
 
+    def __post_init__(self):
+        # the template context shared by every interpolation in a resolve()
+        # call: building it once here avoids copying the external variables
+        # into a fresh kwargs dict for every leaf. The "this" entry is filled
+        # in at render time, since the tree root does not exist yet.
+        self.render_context = dict(self.external_variables)
+
 
 # validation
 # ----------
 
 
-def _validate_schema(schema, keypath=tuple(), allow_default=False):
-    if not isinstance(schema, dict):
-        raise exceptions.InvalidSchemaError("Schema must be a dict.", keypath)
+# the key sets each schema node kind accepts, hoisted to module level so
+# _check_keys does no per-call set construction; the *_WITH_DEFAULT variants
+# pre-apply the extra "default" key allowed inside optional_keys specs
+_DICT_SCHEMA_REQUIRED = frozenset({"type"})
+_DICT_SCHEMA_ALLOWED = frozenset(
+    {"type", "required_keys", "optional_keys", "extra_keys_schema", "nullable"}
+)
+_DICT_SCHEMA_ALLOWED_WITH_DEFAULT = _DICT_SCHEMA_ALLOWED | {"default"}
 
-    if "type" not in schema:
-        raise exceptions.InvalidSchemaError("Required key missing.", keypath + (type,))
+_LIST_SCHEMA_REQUIRED = frozenset({"type", "element_schema"})
+_LIST_SCHEMA_ALLOWED = frozenset({"type", "element_schema", "nullable"})
+_LIST_SCHEMA_ALLOWED_WITH_DEFAULT = _LIST_SCHEMA_ALLOWED | {"default"}
 
-    args = (schema, keypath, allow_default)
+_LEAF_SCHEMA_REQUIRED = frozenset({"type"})
+_LEAF_SCHEMA_ALLOWED = frozenset({"type", "nullable"})
+_LEAF_SCHEMA_ALLOWED_WITH_DEFAULT = _LEAF_SCHEMA_ALLOWED | {"default"}
 
-    if schema["type"] == "dict":
-        _validate_dict_schema(*args)
-    elif schema["type"] == "list":
-        _validate_list_schema(*args)
-    else:
-        _validate_leaf_schema(*args)
 
+def _validate_schema(schema, allow_default=False):
+    """Validate a schema with an explicit work stack instead of recursion.
 
-def _check_keys(provided, required, optional, keypath, allow_default):
-    allowed = required | optional
-    if allow_default:
-        allowed.add("default")
+    Each stack entry is a (schema, path_link, allow_default) triple, where
+    path_link is a linked (parent_link, key) pair as used by the resolver;
+    the keypath tuple is materialized only when an error is raised.
 
-    extra = provided - allowed
+    """
+    stack = [(schema, None, allow_default)]
+
+    while stack:
+        schema, path_link, allow_default = stack.pop()
+
+        if not isinstance(schema, dict):
+            raise exceptions.InvalidSchemaError(
+                "Schema must be a dict.", _materialize_keypath(path_link)
+            )
+
+        if "type" not in schema:
+            raise exceptions.InvalidSchemaError(
+                "Required key missing.", _materialize_keypath(path_link) + (type,)
+            )
+
+        type_ = schema["type"]
+        if isinstance(type_, str):
+            handler = _SCHEMA_VALIDATORS.get(type_, _validate_leaf_schema)
+        else:
+            # an unhashable "type" value would blow up the dict lookup; the
+            # comparison chain this replaced fell through to the leaf handler
+            handler = _validate_leaf_schema
+        handler(schema, path_link, allow_default, stack)
+
+
+def _check_keys(
+    provided, required, allowed, allowed_with_default, path_link, allow_default
+):
+    extra = provided - (allowed_with_default if allow_default else allowed)
     missing = required - provided
 
     if extra:
         exemplar = extra.pop()
-        raise exceptions.InvalidSchemaError("Unexpected key.", keypath + (exemplar,))
+        raise exceptions.InvalidSchemaError(
+            "Unexpected key.", _materialize_keypath((path_link, exemplar))
+        )
 
     if missing:
         exemplar = missing.pop()
-        raise exceptions.InvalidSchemaError("Missing key.", keypath + (exemplar,))
+        raise exceptions.InvalidSchemaError(
+            "Missing key.", _materialize_keypath((path_link, exemplar))
+        )
 
 
-def _validate_dict_schema(dict_schema, keypath, allow_default):
+def _validate_dict_schema(dict_schema, path_link, allow_default, stack):
     _check_keys(
         dict_schema.keys(),
-        required={"type"},
-        optional={"required_keys", "optional_keys", "extra_keys_schema", "nullable"},
-        keypath=keypath,
-        allow_default=allow_default,
+        _DICT_SCHEMA_REQUIRED,
+        _DICT_SCHEMA_ALLOWED,
+        _DICT_SCHEMA_ALLOWED_WITH_DEFAULT,
+        path_link,
+        allow_default,
     )
 
+    # children are pushed in reverse so that they pop in the same order the
+    # recursive walk visited them
+    children = []
+
+    required_link = (path_link, "required_keys")
     for key, key_schema in dict_schema.get("required_keys", {}).items():
-        _validate_schema(key_schema, keypath + ("required_keys", key))
+        children.append((key_schema, (required_link, key), False))
 
+    optional_link = (path_link, "optional_keys")
     for key, key_schema in dict_schema.get("optional_keys", {}).items():
-        _validate_schema(
-            key_schema, keypath + ("optional_keys", key), allow_default=True
-        )
+        children.append((key_schema, (optional_link, key), True))
 
     if "extra_keys_schema" in dict_schema:
-        _validate_schema(
-            dict_schema["extra_keys_schema"], keypath + ("extra_keys_schema",)
+        children.append(
+            (dict_schema["extra_keys_schema"], (path_link, "extra_keys_schema"), False)
         )
 
+    stack.extend(reversed(children))
 
-def _validate_list_schema(list_schema, keypath, allow_default):
+
+def _validate_list_schema(list_schema, path_link, allow_default, stack):
     _check_keys(
         list_schema.keys(),
-        required={"type", "element_schema"},
-        optional={"nullable"},
-        keypath=keypath,
-        allow_default=allow_default,
+        _LIST_SCHEMA_REQUIRED,
+        _LIST_SCHEMA_ALLOWED,
+        _LIST_SCHEMA_ALLOWED_WITH_DEFAULT,
+        path_link,
+        allow_default,
     )
 
-    _validate_schema(
-        list_schema["element_schema"], keypath + ("element_schema",), allow_default
+    stack.append(
+        (list_schema["element_schema"], (path_link, "element_schema"), allow_default)
     )
 
 
-def _validate_leaf_schema(leaf_schema, keypath, allow_default):
+def _validate_leaf_schema(leaf_schema, path_link, allow_default, stack):
     _check_keys(
         leaf_schema.keys(),
-        required={"type"},
-        optional={"nullable"},
-        keypath=keypath,
-        allow_default=allow_default,
+        _LEAF_SCHEMA_REQUIRED,
+        _LEAF_SCHEMA_ALLOWED,
+        _LEAF_SCHEMA_ALLOWED_WITH_DEFAULT,
+        path_link,
+        allow_default,
     )
 
 
-def _validate_any_schema(any_schema, keypath, allow_default):
-    _check_keys(
-        any_schema.keys(),
-        required={"type"},
-        optional={"nullable"},
-        keypath=keypath,
-        allow_default=allow_default,
-    )
+# container kinds dispatch to a handler that pushes children; every other
+# "type" value is a leaf
+_SCHEMA_VALIDATORS = {
+    "dict": _validate_dict_schema,
+    "list": _validate_list_schema,
+}
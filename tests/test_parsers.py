@@ -29,6 +29,16 @@ def test_float_arithmetic():
     assert result == 4.5
 
 
+def test_arithmetic_matches_python_precedence():
+    # given
+    parser = parsers.arithmetic(float)
+
+    # then
+    assert parser("-2**2") == -4
+    assert parser("2**-1") == 0.5
+    assert parser("2**3**2") == 512
+
+
 # logic
 
 
@@ -92,6 +102,13 @@ def test_smartdate_first_date_before_simplifies_datetimes_to_dates():
     ) == datetime.date(2021, 9, 13)
 
 
+def test_smartdate_batch():
+    assert parsers.smartdate_batch(["2021-10-05", "3 days after 2021-10-05"]) == [
+        datetime.date(2021, 10, 5),
+        datetime.date(2021, 10, 8),
+    ]
+
+
 # smartdatetime
 # -------------
 
@@ -176,3 +193,12 @@ def test_smartdatetime_first_date_after_allows_overwriting_time_with_at():
     assert parsers.smartdatetime(
         "first monday after 2021-09-14 23:59:00 at 22:00:00"
     ) == datetime.datetime(2021, 9, 20, 22, 0, 0)
+
+
+def test_smartdatetime_batch():
+    assert parsers.smartdatetime_batch(
+        ["2021-10-05 23:59:10", "3 hours after 2021-10-05 23:59:15"]
+    ) == [
+        datetime.datetime(2021, 10, 5, 23, 59, 10),
+        datetime.datetime(2021, 10, 6, 2, 59, 15),
+    ]